@@ -5,7 +5,16 @@ try:
 except ModuleNotFoundError:
     # when running as local module with run.sh
     from .models.sensor import RandintGenerator
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional, fall back to the default asyncio event loop
+    uvloop = None
 
 
 if __name__ == '__main__':
-    asyncio.run(Module.run_from_registry())
+    # uvloop.run was added in uvloop 0.18, older versions fall back to asyncio
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(Module.run_from_registry())
+    else:
+        asyncio.run(Module.run_from_registry())
@@ -1,9 +1,13 @@
-from typing import (Any, ClassVar, Dict, Final, List, Mapping, Optional,
-                    Sequence, Tuple)
+import functools
+import logging
+import uuid
+from operator import attrgetter
+from typing import (Any, Awaitable, Callable, ClassVar, Dict, Final, Iterator,
+                    List, Mapping, Optional, Sequence, Tuple)
 
 import numpy as np
 from typing_extensions import Self
-from viam.components.sensor import *
+from viam.components.sensor import Sensor
 from viam.proto.app.robot import ComponentConfig
 from viam.proto.common import Geometry, ResourceName
 from viam.resource.base import ResourceBase
@@ -11,10 +15,81 @@ from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
 from viam.utils import SensorReading, ValueTypes
 
+# Supported integer dtypes, ordered for error messages, and as a set for membership checks
+DTYPE_NAMES: Final[Tuple[str, ...]] = ("int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64")
+VALID_DTYPES: Final[frozenset] = frozenset(DTYPE_NAMES)
+
+# Supported bit generators. SFC64 is the default because it has the highest
+# throughput of the bundled generators for integer sampling, see
+# https://numpy.org/doc/stable/reference/random/performance.html
+BIT_GENERATORS: Final[Dict[str, type]] = {
+    "sfc64": np.random.SFC64,
+    "pcg64": np.random.PCG64,
+    "philox": np.random.Philox,
+    "mt19937": np.random.MT19937,
+}
+
+# Number of random bits in each random_raw word; MT19937 emits 32-bit outputs
+RAW_WORD_BITS: Final[Dict[str, int]] = {
+    "sfc64": 64,
+    "pcg64": 64,
+    "philox": 64,
+    "mt19937": 32,
+}
+
+# Number of values drawn ahead of time per refill of the get_readings prefetch block,
+# rounded down to whole readings but never less than one reading
+PREFETCH_VALUES: Final[int] = 4096
+
+# Largest power-of-two range served by unpacking raw bit generator words into narrow lanes
+MAX_PACKED_RANGE: Final[int] = 2**4
+
+# Number of readings returned per generate_batch_stream call
+STREAM_CHUNK_SIZE: Final[int] = 10_000
+
+# Number of unfinished generate_batch_stream streams kept per sensor before the oldest is dropped
+MAX_BATCH_STREAMS: Final[int] = 16
+
+# Reads the string out of a protobuf Value, used to map over ListValue entries
+_get_string = attrgetter("string_value")
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_dtype(name: str) -> np.dtype:
+    """Resolves a dtype name to a numpy dtype, cached across sensors and reconfigures."""
+    return np.dtype(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_numba_kernels() -> Optional[Tuple[Callable, Callable]]:
+    """
+    Imports numba and builds the jitted (seed, fill_batch) helpers, or returns None if
+    numba is not installed. numba is optional and slow to import, so this only runs
+    once a sensor is configured with use_numba.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True)
+    def seed(value):
+        """Seeds numba's internal random state, which is separate from numpy's."""
+        np.random.seed(value)
+
+    @numba.njit(cache=True)
+    def fill_batch(out, low, high):
+        """Fills a C-contiguous array in place with random integers in [low, high)."""
+        flat = out.reshape(-1)
+        for i in range(flat.size):
+            flat[i] = np.random.randint(low, high)
+
+    return seed, fill_batch
+
 
 class RandintGenerator(Sensor, EasyResource):
     """
-    A Viam sensor module that generates random integer data using numpy.random.randint.
+    A Viam sensor module that generates random integer data using numpy's Generator API.
     
     This module is designed for testing and development purposes where fake sensor data
     is needed. Provides flexible configuration options for generating single or multiple 
@@ -23,15 +98,46 @@ class RandintGenerator(Sensor, EasyResource):
     
     MODEL: ClassVar[Model] = Model(ModelFamily("hunter", "randint-generator"), "sensor")
 
+    # The viam base classes keep an instance __dict__ (name, logger, ...), so only
+    # the attributes owned by this class are declared as slots.
+    __slots__ = (
+        "low",
+        "high",
+        "num_readings",
+        "reading_names",
+        "dtype",
+        "seed",
+        "bit_generator",
+        "use_numba",
+        "_np_dtype",
+        "_rng",
+        "_bitwidth",
+        "_full_range",
+        "_make_readings",
+        "_prefetch",
+        "_prefetch_idx",
+        "_config_snapshot",
+        "_batch_streams",
+    )
+
     def __init__(self, name: str):
         super().__init__(name)
         # Default configuration values
         self.low = 0
         self.high = 100
         self.num_readings = 1
-        self.reading_names = ["value"]
+        self.reading_names = ("value",)
+        self._make_readings = self._compile_readings_builder(self.reading_names)
         self.dtype = "int32"
         self.seed = None
+        self.bit_generator = "sfc64"
+        self.use_numba = False
+        self._np_dtype = _resolve_dtype(self.dtype)
+        self._bitwidth = None
+        self._full_range = False
+        self._reset_generator()
+        self._config_snapshot = self._build_config_snapshot()
+        self._batch_streams: Dict[str, Iterator[Dict[str, ValueTypes]]] = {}
         
     @classmethod
     def new(
@@ -56,6 +162,8 @@ class RandintGenerator(Sensor, EasyResource):
         - reading_names (list, optional): Names for each reading. Default: ["value"]
         - dtype (str, optional): Data type for integers. Default: "int32"
         - seed (int, optional): Random seed for reproducibility. Default: None
+        - bit_generator (str, optional): sfc64, pcg64, philox or mt19937. Default: "sfc64"
+        - use_numba (bool, optional): Draw generate_batch values with numba. Default: False
         
         Args:
             config (ComponentConfig): The configuration for this resource
@@ -68,25 +176,28 @@ class RandintGenerator(Sensor, EasyResource):
         
         if "num_readings" in attributes and "reading_names" in attributes:
             num_readings = int(attributes["num_readings"].number_value)
-            reading_names = [item.string_value for item in attributes["reading_names"].list_value.values]
+            reading_names = list(map(_get_string, attributes["reading_names"].list_value.values))
             
             if len(reading_names) != num_readings:
                 raise ValueError(f"Number of reading_names ({len(reading_names)}) must match num_readings ({num_readings})")
         
-        # Validate bounds
-        if "low" in attributes and "high" in attributes:
-            low = int(attributes["low"].number_value)
-            high = int(attributes["high"].number_value)
-            
-            if low >= high:
-                raise ValueError(f"low ({low}) must be less than high ({high})")
-        
         # Validate dtype
         if "dtype" in attributes:
             dtype = attributes["dtype"].string_value
-            valid_dtypes = ["int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64"]
-            if dtype not in valid_dtypes:
-                raise ValueError(f"dtype must be one of {valid_dtypes}, got {dtype}")
+            if dtype not in VALID_DTYPES:
+                raise ValueError(f"dtype must be one of {list(DTYPE_NAMES)}, got {dtype}")
+        
+        # Validate bounds, using the same defaults as reconfigure
+        low = int(attributes["low"].number_value) if "low" in attributes else 0
+        high = int(attributes["high"].number_value) if "high" in attributes else 100
+        dtype = attributes["dtype"].string_value if "dtype" in attributes else "int32"
+        cls._check_bounds(low, high, _resolve_dtype(dtype))
+        
+        # Validate bit generator
+        if "bit_generator" in attributes:
+            bit_generator = attributes["bit_generator"].string_value
+            if bit_generator not in BIT_GENERATORS:
+                raise ValueError(f"bit_generator must be one of {list(BIT_GENERATORS)}, got {bit_generator}")
         
         return [], []  # No dependencies required
 
@@ -102,52 +213,190 @@ class RandintGenerator(Sensor, EasyResource):
         """
         attributes = config.attributes.fields
         
+        # Parse and check the whole config into locals first, so a bad config raises
+        # before any state is changed and get_readings never sees a half-applied config
+        
         # Configure bounds
-        self.low = int(attributes.get("low", self._make_number_value(0)).number_value)
-        self.high = int(attributes.get("high", self._make_number_value(100)).number_value)
+        low = int(attributes["low"].number_value) if "low" in attributes else 0
+        high = int(attributes["high"].number_value) if "high" in attributes else 100
         
         # Configure number of readings
-        self.num_readings = int(attributes.get("num_readings", self._make_number_value(1)).number_value)
+        num_readings = int(attributes["num_readings"].number_value) if "num_readings" in attributes else 1
         
         # Configure reading names
         if "reading_names" in attributes:
-            self.reading_names = [
-                item.string_value for item in attributes["reading_names"].list_value.values
-            ]
+            reading_names = tuple(map(_get_string, attributes["reading_names"].list_value.values))
         else:
             # Generate default names based on num_readings
-            if self.num_readings == 1:
-                self.reading_names = ["value"]
+            if num_readings == 1:
+                reading_names = ("value",)
             else:
-                self.reading_names = [f"value_{i+1}" for i in range(self.num_readings)]
+                reading_names = tuple(f"value_{i+1}" for i in range(num_readings))
         
         # Configure data type
-        self.dtype = attributes.get("dtype", self._make_string_value("int32")).string_value
+        dtype = attributes["dtype"].string_value if "dtype" in attributes else "int32"
+        if dtype not in VALID_DTYPES:
+            raise ValueError(f"dtype must be one of {list(DTYPE_NAMES)}, got {dtype}")
         
         # Configure random seed
-        if "seed" in attributes:
-            self.seed = int(attributes["seed"].number_value)
-            np.random.seed(self.seed)
+        seed = int(attributes["seed"].number_value) if "seed" in attributes else None
+        
+        # Configure bit generator
+        bit_generator = attributes["bit_generator"].string_value if "bit_generator" in attributes else "sfc64"
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(f"bit_generator must be one of {list(BIT_GENERATORS)}, got {bit_generator}")
+        
+        # Resolve the dtype once rather than on every call, and check the bounds here
+        # so get_readings never sees a range the dtype cannot hold
+        np_dtype = _resolve_dtype(dtype)
+        self._check_bounds(low, high, np_dtype)
+        
+        # Configure numba batch generation, falling back to numpy if it is not installed or
+        # the bounds do not fit numba's int64 randint
+        use_numba = attributes["use_numba"].bool_value if "use_numba" in attributes else False
+        if use_numba:
+            int64 = np.iinfo(np.int64)
+            if low < int64.min or high > int64.max or high - low > int64.max:
+                self.logger.warning(f"use_numba is set but low ({low}) and high ({high}) do not "
+                                    f"fit numba's int64 range, falling back to numpy")
+                use_numba = False
+            elif _load_numba_kernels() is None:
+                self.logger.warning("use_numba is set but numba is not installed, falling back to numpy")
+                use_numba = False
+        
+        # The config is valid, apply it
+        self.low = low
+        self.high = high
+        self.num_readings = num_readings
+        self.reading_names = reading_names
+        # Only num_readings values are drawn, so extra names are ignored
+        self._make_readings = self._compile_readings_builder(reading_names[:num_readings])
+        self.dtype = dtype
+        self._np_dtype = np_dtype
+        self.seed = seed
+        self.bit_generator = bit_generator
+        self.use_numba = use_numba
+        self._reset_generator()
+        
+        # A power-of-two range needs only log2(range) bits per value, so several values
+        # can be unpacked from each raw word instead of drawing one word apiece
+        value_range = self.high - self.low
+        if value_range & (value_range - 1) == 0 and value_range <= MAX_PACKED_RANGE:
+            self._bitwidth = value_range.bit_length() - 1
         else:
-            self.seed = None
+            self._bitwidth = None
+        
+        # A range spanning the whole dtype can be read straight from raw bit generator output
+        info = np.iinfo(self._np_dtype)
+        self._full_range = self.low == info.min and self.high == info.max + 1
+        
+        self._config_snapshot = self._build_config_snapshot()
+        
+        # Drop any in-progress streams, their chunks would no longer match the config
+        self._batch_streams.clear()
         
         self.logger.info(f"Configured randint generator: low={self.low}, high={self.high}, "
                         f"num_readings={self.num_readings}, reading_names={self.reading_names}, "
-                        f"dtype={self.dtype}, seed={self.seed}")
-
-    def _make_number_value(self, value: float):
-        """Helper to create a number value for default handling."""
-        from google.protobuf.struct_pb2 import Value
-        v = Value()
-        v.number_value = value
-        return v
-    
-    def _make_string_value(self, value: str):
-        """Helper to create a string value for default handling."""
-        from google.protobuf.struct_pb2 import Value
-        v = Value()
-        v.string_value = value
-        return v
+                        f"dtype={self.dtype}, seed={self.seed}, bit_generator={self.bit_generator}, "
+                        f"use_numba={self.use_numba}")
+
+    @staticmethod
+    def _compile_readings_builder(reading_names: Sequence[str]) -> Callable[[Sequence[int]], Dict[str, int]]:
+        """
+        Compiles a function that maps a sequence of values to the readings dict.
+        
+        The reading names are fixed between reconfigures, so the dict is emitted as a single
+        literal, e.g. ``lambda v: {'a': v[0], 'b': v[1]}``, instead of zipping on every call.
+        Names are embedded with repr so arbitrary strings stay plain literals.
+        """
+        items = ", ".join(f"{name!r}: v[{i}]" for i, name in enumerate(reading_names))
+        return eval(f"lambda v: {{{items}}}", {})
+
+    def _build_config_snapshot(self) -> Dict[str, ValueTypes]:
+        """Helper to build the get_config response, cached until the config or seed changes."""
+        return {
+            "low": self.low,
+            "high": self.high,
+            "num_readings": self.num_readings,
+            "reading_names": self.reading_names,
+            "dtype": self.dtype,
+            "seed": self.seed,
+            "bit_generator": self.bit_generator,
+            "use_numba": self.use_numba
+        }
+
+    @staticmethod
+    def _check_bounds(low: int, high: int, dtype: np.dtype):
+        """Helper to check that low < high and that [low, high) fits within dtype."""
+        if low >= high:
+            raise ValueError(f"low ({low}) must be less than high ({high})")
+        info = np.iinfo(dtype)
+        if low < info.min or high > info.max + 1:
+            raise ValueError(f"low ({low}) and high ({high}) must fit within the {dtype} range "
+                             f"[{info.min}, {info.max + 1})")
+
+    def _reset_generator(self):
+        """Helper to rebuild the Generator from the current config and drop prefetched values."""
+        self._rng = np.random.Generator(BIT_GENERATORS[self.bit_generator](self.seed))
+        self._prefetch = np.empty(0, dtype=self._np_dtype)
+        self._prefetch_idx = 0
+        if self.use_numba and self.seed is not None:
+            # numba's random state is global to the process, so this also reseeds the
+            # numba batches of every other sensor in the module
+            numba_seed, _ = _load_numba_kernels()
+            numba_seed(self.seed)
+
+    def _next_values(self, n: int) -> List[int]:
+        """
+        Returns the next n values from the prefetch block, refilling it when exhausted.
+        
+        Drawing about PREFETCH_VALUES values per refill amortizes the numpy call overhead
+        across many get_readings calls. The block stays a compact ndarray and only the
+        returned slice is converted to Python ints.
+        """
+        start = self._prefetch_idx
+        end = start + n
+        if end > len(self._prefetch):
+            self._prefetch = self._draw_integers(n * max(PREFETCH_VALUES // n, 1))
+            start, end = 0, n
+        self._prefetch_idx = end
+        return self._prefetch[start:end].tolist()
+
+    def _draw_integers(self, shape) -> np.ndarray:
+        """Helper to draw an array of random integers in [low, high) from the Generator."""
+        if self._full_range:
+            # Reinterpret raw words as dtype, skipping the bounded-integer step entirely
+            count = int(np.prod(shape))
+            word_bits = RAW_WORD_BITS[self.bit_generator]
+            words = self._rng.bit_generator.random_raw(size=-(-count * self._np_dtype.itemsize * 8 // word_bits))
+            if word_bits == 32:
+                words = words.astype(np.uint32)
+            return words.view(self._np_dtype)[:count].reshape(shape)
+        
+        if self._bitwidth is None:
+            return self._rng.integers(self.low, self.high, size=shape, dtype=self._np_dtype, endpoint=False)
+        
+        count = int(np.prod(shape))
+        if self._bitwidth == 0:
+            values = np.zeros(count, dtype=self._np_dtype)
+        else:
+            # Split each raw word into word_bits // bitwidth lanes of bitwidth bits
+            lanes = RAW_WORD_BITS[self.bit_generator] // self._bitwidth
+            shifts = np.arange(0, lanes * self._bitwidth, self._bitwidth, dtype=np.uint64)
+            mask = np.uint64((1 << self._bitwidth) - 1)
+            words = self._rng.bit_generator.random_raw(size=-(-count // lanes))
+            values = ((words[:, np.newaxis] >> shifts) & mask).ravel()[:count].astype(self._np_dtype)
+        values += self.low
+        return values.reshape(shape)
+
+    def _draw_batch(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Helper to draw an array of random integers for generate_batch."""
+        if self.use_numba:
+            _, numba_fill_batch = _load_numba_kernels()
+            out = np.empty(shape, dtype=self._np_dtype)
+            numba_fill_batch(out, self.low, self.high)
+            return out
+        return self._draw_integers(shape)
 
     async def get_readings(
         self,
@@ -162,29 +411,12 @@ class RandintGenerator(Sensor, EasyResource):
         Returns:
             Mapping[str, SensorReading]: Dictionary of reading names to their random values
         """
-        try:
-            # Convert dtype string to numpy dtype
-            np_dtype = getattr(np, self.dtype)
-            
-            # Generate random integers
-            if self.num_readings == 1:
-                # Single value
-                value = np.random.randint(self.low, self.high, dtype=np_dtype)
-                readings = {self.reading_names[0]: int(value)}
-            else:
-                # Multiple values
-                values = np.random.randint(self.low, self.high, size=self.num_readings, dtype=np_dtype)
-                readings = {
-                    name: int(value) 
-                    for name, value in zip(self.reading_names, values)
-                }
-            
-            self.logger.debug(f"Generated readings: {readings}")
-            return readings
-            
-        except Exception as e:
-            self.logger.error(f"Error generating random integers: {e}")
-            raise
+        # Serve random integers from the prefetch block
+        readings = self._make_readings(self._next_values(self.num_readings))
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Generated readings: %s", readings)
+        return readings
 
     async def do_command(
         self,
@@ -200,6 +432,7 @@ class RandintGenerator(Sensor, EasyResource):
         - get_config: Returns current configuration
         - reseed: Sets a new random seed  
         - generate_batch: Generates a batch of readings
+        - generate_batch_stream: Generates a large batch in chunks across successive calls
         
         Args:
             command: Command dictionary with "command" key
@@ -211,60 +444,117 @@ class RandintGenerator(Sensor, EasyResource):
         if not cmd:
             raise ValueError("Missing 'command' field in do_command")
         
-        if cmd == "get_config":
+        handler = self._COMMANDS.get(cmd)
+        if handler is None:
+            raise NotImplementedError(f"Command '{cmd}' is not implemented")
+        return await handler(self, command)
+
+    async def _cmd_get_config(self, command: Mapping[str, ValueTypes]) -> Mapping[str, ValueTypes]:
+        """Returns the current configuration."""
+        # reading_names is cached as a tuple, so each caller gets its own list
+        config = dict(self._config_snapshot)
+        config["reading_names"] = list(config["reading_names"])
+        return config
+
+    async def _cmd_reseed(self, command: Mapping[str, ValueTypes]) -> Mapping[str, ValueTypes]:
+        """Sets a new random seed."""
+        new_seed = command.get("seed")
+        if new_seed is None:
+            raise ValueError("reseed command requires 'seed' parameter")
+        if not isinstance(new_seed, (int, float)):
+            raise ValueError("seed must be an integer")
+        
+        self.seed = int(new_seed)
+        self._reset_generator()
+        self._config_snapshot["seed"] = self.seed
+        self.logger.info(f"Reseeded random generator with seed: {self.seed}")
+        return {"status": "reseeded", "seed": self.seed}
+
+    def _parse_batch_command(self, command: Mapping[str, ValueTypes]) -> Tuple[int, str]:
+        """Helper to read and check the size and layout of a batch command."""
+        batch_size = command.get("size", 10)
+        if not isinstance(batch_size, (int, float)) or batch_size <= 0:
+            raise ValueError("batch size must be a positive integer")
+        
+        layout = command.get("layout", "rows")
+        if layout not in ("rows", "columns"):
+            raise ValueError(f"layout must be 'rows' or 'columns', got {layout}")
+        
+        return int(batch_size), layout
+
+    def _build_batch(self, batch_size: int, layout: str) -> Dict[str, ValueTypes]:
+        """Helper to draw a batch of readings and build the batch response."""
+        if self.num_readings == 1:
+            batch_values = self._draw_batch((batch_size,))
             return {
-                "low": self.low,
-                "high": self.high,
-                "num_readings": self.num_readings,
-                "reading_names": self.reading_names,
-                "dtype": self.dtype,
-                "seed": self.seed
+                "batch": batch_values.tolist(),
+                "batch_size": batch_size,
+                "reading_name": self.reading_names[0]
             }
-        
-        elif cmd == "reseed":
-            new_seed = command.get("seed")
-            if new_seed is None:
-                raise ValueError("reseed command requires 'seed' parameter")
-            if not isinstance(new_seed, (int, float)):
-                raise ValueError("seed must be an integer")
-            
-            self.seed = int(new_seed)
-            np.random.seed(self.seed)
-            self.logger.info(f"Reseeded random generator with seed: {self.seed}")
-            return {"status": "reseeded", "seed": self.seed}
-        
-        elif cmd == "generate_batch":
-            batch_size = command.get("size", 10)
-            if not isinstance(batch_size, (int, float)) or batch_size <= 0:
-                raise ValueError("batch size must be a positive integer")
-            
-            batch_size = int(batch_size)
-            np_dtype = getattr(np, self.dtype)
-            
-            if self.num_readings == 1:
-                batch_values = np.random.randint(self.low, self.high, size=batch_size, dtype=np_dtype)
-                return {
-                    "batch": [int(val) for val in batch_values],
-                    "batch_size": batch_size,
-                    "reading_name": self.reading_names[0]
-                }
+        else:
+            # Draw one contiguous column per reading and only transpose for the row layout
+            columns = self._draw_batch((self.num_readings, batch_size)).tolist()
+            if layout == "columns":
+                batch = dict(zip(self.reading_names, columns))
             else:
-                batch_values = np.random.randint(
-                    self.low, self.high, 
-                    size=(batch_size, self.num_readings), 
-                    dtype=np_dtype
-                )
-                return {
-                    "batch": [
-                        {name: int(val) for name, val in zip(self.reading_names, row)}
-                        for row in batch_values
-                    ],
-                    "batch_size": batch_size,
-                    "reading_names": self.reading_names
-                }
+                batch = list(map(self._make_readings, zip(*columns)))
+            return {
+                "batch": batch,
+                "batch_size": batch_size,
+                "reading_names": list(self.reading_names)
+            }
+
+    def _iter_batch_chunks(self, size: int, layout: str) -> Iterator[Dict[str, ValueTypes]]:
+        """Yields batch responses of at most STREAM_CHUNK_SIZE readings until size is reached."""
+        remaining = size
+        while remaining > 0:
+            chunk_size = min(STREAM_CHUNK_SIZE, remaining)
+            remaining -= chunk_size
+            response = self._build_batch(chunk_size, layout)
+            response["remaining"] = remaining
+            yield response
+
+    async def _cmd_generate_batch(self, command: Mapping[str, ValueTypes]) -> Mapping[str, ValueTypes]:
+        """Generates a batch of readings."""
+        batch_size, layout = self._parse_batch_command(command)
+        return self._build_batch(batch_size, layout)
+
+    async def _cmd_generate_batch_stream(self, command: Mapping[str, ValueTypes]) -> Mapping[str, ValueTypes]:
+        """
+        Generates a large batch in chunks across successive calls.
         
+        A call with "size" starts a new stream and returns its first chunk along with a
+        "stream_id"; calls with that "stream_id" return the next chunk. Each stream holds
+        at most one chunk in memory at a time.
+        """
+        if "size" in command:
+            # Check the request before evicting anything, so a bad request leaves other streams intact
+            batch_size, layout = self._parse_batch_command(command)
+            stream_id = uuid.uuid4().hex
+            if len(self._batch_streams) >= MAX_BATCH_STREAMS:
+                # Drop the oldest unfinished stream
+                del self._batch_streams[next(iter(self._batch_streams))]
+            self._batch_streams[stream_id] = self._iter_batch_chunks(batch_size, layout)
+        elif "stream_id" in command:
+            stream_id = command["stream_id"]
+            if stream_id not in self._batch_streams:
+                raise ValueError(f"Unknown or finished stream_id: {stream_id}")
         else:
-            raise NotImplementedError(f"Command '{cmd}' is not implemented")
+            raise ValueError("generate_batch_stream requires 'size' to start a stream or 'stream_id' to continue one")
+        
+        response = next(self._batch_streams[stream_id])
+        if response["remaining"] == 0:
+            del self._batch_streams[stream_id]
+        response["stream_id"] = stream_id
+        return response
+
+    # do_command handlers keyed by command name
+    _COMMANDS: ClassVar[Dict[str, Callable[..., Awaitable[Mapping[str, ValueTypes]]]]] = {
+        "get_config": _cmd_get_config,
+        "reseed": _cmd_reseed,
+        "generate_batch": _cmd_generate_batch,
+        "generate_batch_stream": _cmd_generate_batch_stream,
+    }
 
     async def get_geometries(
         self, *, extra: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None